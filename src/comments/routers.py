@@ -7,7 +7,7 @@ from sqlalchemy.future import select
 from src.comments.models import Comment
 from src.comments.schemas import CommentCreate, CommentResponse, CommentUpdate
 from src.database import get_async_session
-from src.security import JWTBearer
+from src.security import access_bearer
 
 router = APIRouter(
     prefix="/comments",
@@ -22,7 +22,7 @@ router = APIRouter(
 )
 async def get_comments(
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Comment).where(Comment.user_id == user_id)
     query_result = await session.scalars(query)
@@ -34,7 +34,7 @@ async def get_comments(
 async def create_comment(
     payload: CommentCreate,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     new_comment = Comment(
         content=payload.content.model_dump(), user_id=user_id, event_id=payload.event_id
@@ -49,7 +49,7 @@ async def create_comment(
 async def get_comment(
     comment_id: int,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Comment).where(Comment.id == comment_id, Comment.user_id == user_id)
     query_result = await session.scalars(query)
@@ -64,7 +64,7 @@ async def update_comment(
     comment_id: int,
     comment: CommentUpdate,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Comment).where(Comment.id == comment_id, Comment.user_id == user_id)
     query_result = await session.scalars(query)
@@ -88,7 +88,7 @@ async def update_comment(
 async def delete_comment(
     comment_id: int,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Comment).where(Comment.id == comment_id, Comment.user_id == user_id)
     query_result = await session.scalars(query)
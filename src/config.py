@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     db_user: str
     db_pass: SecretStr
     db_name: str
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 3600
 
     algorithm: str
     jwt_secret: SecretStr
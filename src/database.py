@@ -1,8 +1,13 @@
+from asyncio import current_task
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
 
 from src.config import settings as s
 
@@ -13,10 +18,20 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(DATABASE_URL, poolclass=NullPool)
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=s.db_pool_size,
+    max_overflow=s.db_max_overflow,
+    pool_pre_ping=True,
+    pool_recycle=s.db_pool_recycle,
+)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+# Una sessione per task asyncio (cioè per richiesta), condivisa tra le dipendenze
+scoped_session = async_scoped_session(async_session_maker, scopefunc=current_task)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session_maker() as session:
-        yield session
+    try:
+        yield scoped_session()
+    finally:
+        await scoped_session.remove()
@@ -1,27 +1,29 @@
-import base64
 import os
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
+import pybase64
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from hashlib import sha256
 
 from src.config import settings as s
 
 
+# Chiave AES-256 derivata una sola volta all'import (hashlib usa OpenSSL)
+_AES_KEY: bytes = sha256(s.encryption_key.get_secret_value().encode()).digest()
+
+
 class Encryption:
-    __key = sha256(s.encryption_key.get_secret_value().encode()).digest()
+    __aesgcm = AESGCM(_AES_KEY)
+    __nonce_size = 12
 
     def encrypt(self, plaintext: str) -> str:
-        iv = os.urandom(16)
-        cipher = AES.new(self.__key, AES.MODE_CBC, iv)
-        ciphertext = cipher.encrypt(pad(plaintext.encode(), AES.block_size))
-        return base64.b64encode(iv + ciphertext).decode("utf-8")
+        nonce = os.urandom(self.__nonce_size)
+        ciphertext = self.__aesgcm.encrypt(nonce, plaintext.encode(), None)
+        return pybase64.b64encode_as_string(nonce + ciphertext)
 
     def decrypt(self, encrypted_text: str) -> str:
-        raw_data = base64.b64decode(encrypted_text)
-        iv = raw_data[:16]
-        ciphertext = raw_data[16:]
-        cipher = AES.new(self.__key, AES.MODE_CBC, iv)
-        decrypted = unpad(cipher.decrypt(ciphertext), AES.block_size)
+        raw_data = memoryview(pybase64.b64decode_as_bytearray(encrypted_text))
+        nonce = raw_data[: self.__nonce_size]
+        ciphertext = raw_data[self.__nonce_size :]
+        decrypted = self.__aesgcm.decrypt(nonce, ciphertext, None)
         return decrypted.decode("utf-8")
 
 
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.database import get_async_session
 from src.events.models import Event
 from src.events.schemas import EventResponse, EventCreate, EventUpdate
-from src.security import JWTBearer
+from src.security import access_bearer
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -24,7 +24,7 @@ async def get_events(session: AsyncSession = Depends(get_async_session)):
 async def create_event(
     payload: EventCreate,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     new_event = Event(
         name=payload.name,
@@ -43,7 +43,7 @@ async def create_event(
 async def get_event(
     event_id: int,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Event).where(Event.id == event_id, Event.user_id == user_id)
     query_result = await session.scalars(query)
@@ -60,7 +60,7 @@ async def update_event(
     event_id: int,
     payload: EventUpdate,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Event).where(Event.id == event_id, Event.user_id == user_id)
     query_result = await session.scalars(query)
@@ -81,7 +81,7 @@ async def update_event(
 async def delete_event(
     event_id: int,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Event).where(Event.id == event_id, Event.user_id == user_id)
     query_result = await session.scalars(query)
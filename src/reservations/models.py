@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, ForeignKey, DateTime, func
+from sqlalchemy import Integer, ForeignKey, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -8,6 +8,14 @@ from src.database import Base
 
 class Reservation(Base):
     __tablename__ = "reservations"
+    __table_args__ = (
+        Index("ix_reservations_user_id_id", "user_id", "id"),
+        Index(
+            "ix_reservations_event_id_num_guests",
+            "event_id",
+            postgresql_include=["num_guests"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     num_guests: Mapped[int] = mapped_column(Integer)
@@ -1,6 +1,8 @@
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import Integer, func, insert, literal
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -12,18 +14,19 @@ from src.reservations.schemas import (
     ReservationResponse,
     ReservationUpdate,
 )
-from src.security import JWTBearer
+from src.security import access_bearer
 
 router = APIRouter(
     prefix="/reservations",
     tags=["reservations"],
+    default_response_class=ORJSONResponse,
 )
 
 
 @router.get("/", response_model=Optional[List[ReservationResponse]])
 async def get_reservations(
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Reservation).where(Reservation.user_id == user_id)
     query_result = await session.scalars(query)
@@ -35,7 +38,7 @@ async def get_reservations(
 async def create_reservation(
     payload: ReservationCreate,
     session: AsyncSession = Depends(get_async_session),  # la sessione viene gestita da FastAPI
-    user_id: int = Depends(JWTBearer()),                 # otteniamo l'id dell'utente dal JWT
+    user_id: int = Depends(access_bearer),              # otteniamo l'id dell'utente dal JWT
 ):
     # ---------------------------------------------
     # 1️⃣ Inizio una transazione esplicita
@@ -43,56 +46,53 @@ async def create_reservation(
     # qui dentro siano atomiche: commit se tutto va bene,
     # rollback automatico se c'è un errore
     # ---------------------------------------------
-    async with session.begin():  
-        
-        # ---------------------------------------------
-        # 2️⃣ Seleziono l'evento e applico un lock di tipo FOR UPDATE
-        # Questo impedisce ad altre transazioni di modificare
-        # lo stesso record fino a quando non finiamo questa transazione
-        # ---------------------------------------------
-        query = select(Event).where(Event.id == payload.event_id).with_for_update()
-        event = (await session.scalars(query)).first()  # prendo il primo risultato
+    async with session.begin():
 
         # ---------------------------------------------
-        # 3️⃣ Controllo se l'evento esiste
-        # Se non esiste, lanciamo un'eccezione HTTP 404
+        # 2️⃣ Seleziono l'evento e applico un lock di tipo FOR UPDATE
+        # Il lock è una query a sé: la somma dei posti viene calcolata
+        # nell'istruzione successiva, che vede anche le prenotazioni
+        # confermate da chi ha tenuto il lock prima di noi
         # ---------------------------------------------
-        if not event:
+        query = select(Event.id).where(Event.id == payload.event_id).with_for_update()
+        if (await session.scalars(query)).first() is None:
             raise HTTPException(status_code=404, detail="Event not found")
 
         # ---------------------------------------------
-        # 4️⃣ Calcolo il numero di posti già prenotati
-        # Sommo tutti i num_guests delle prenotazioni esistenti
+        # 3️⃣ Inserisco la prenotazione con un unico INSERT ... SELECT
+        # La riga viene creata solo se la somma dei posti già prenotati
+        # (calcolata dal database) + quelli richiesti non supera la
+        # capacità dell'evento; RETURNING ci restituisce direttamente
+        # la prenotazione completa (id e created_at compresi)
         # ---------------------------------------------
-        query = select(Reservation.num_guests).where(
-            Reservation.event_id == payload.event_id
+        taken_seats = (
+            select(func.coalesce(func.sum(Reservation.num_guests), 0))
+            .where(Reservation.event_id == Event.id)
+            .scalar_subquery()
+        )
+        available_event = select(
+            literal(payload.num_guests, Integer),
+            literal(user_id, Integer),
+            Event.id,
+        ).where(
+            Event.id == payload.event_id,
+            taken_seats + payload.num_guests <= Event.capacity,
+        )
+        query = (
+            insert(Reservation)
+            .from_select(["num_guests", "user_id", "event_id"], available_event)
+            .returning(Reservation)
         )
-        reservations = await session.scalars(query)
-        current_reservations = sum(reservations.all())
+        new_reservation = (await session.scalars(query)).first()
 
-        # ---------------------------------------------
-        # 5️⃣ Controllo se ci sono abbastanza posti disponibili
-        # Se la somma dei posti già prenotati + quelli richiesti
-        # supera la capacità dell'evento, lanciamo un errore
-        # ---------------------------------------------
-        if current_reservations + payload.num_guests > event.capacity:
+        # Nessuna riga inserita: l'evento esiste (è bloccato), quindi
+        # i posti non sono sufficienti
+        if new_reservation is None:
             raise HTTPException(status_code=400, detail="Not enough seats available")
 
-        # ---------------------------------------------
-        # 6️⃣ Creo la nuova prenotazione
-        # Non serve fare commit qui: la transazione esplicita
-        # lo farà automaticamente alla fine del blocco
-        # ---------------------------------------------
-        new_reservation = Reservation(
-            num_guests=payload.num_guests,
-            user_id=user_id,
-            event_id=payload.event_id
-        )
-        session.add(new_reservation)  # aggiungiamo l'oggetto alla sessione
-
     # ---------------------------------------------
-    # 7️⃣ Fine del blocco `async with session.begin()`
-    # - se tutto va bene → commit automatico
+    # 4️⃣ Fine del blocco `async with session.begin()`
+    # - se tutto va bene → commit automatico (e rilascio del lock)
     # - se c'è un errore → rollback automatico
     # La sessione verrà chiusa automaticamente da Depends(get_async_session)
     # ---------------------------------------------
@@ -104,7 +104,7 @@ async def create_reservation(
 async def get_reservation(
     reservation_id: int,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Reservation).where(
         Reservation.id == reservation_id, Reservation.user_id == user_id
@@ -123,7 +123,7 @@ async def update_reservation(
     reservation_id: int,
     payload: ReservationUpdate,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Reservation).where(
         Reservation.id == reservation_id, Reservation.user_id == user_id
@@ -146,7 +146,7 @@ async def update_reservation(
 async def delete_reservation(
     reservation_id: int,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(Reservation).where(
         Reservation.id == reservation_id, Reservation.user_id == user_id
@@ -1,16 +1,54 @@
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal
 from pydantic import BaseModel
 
 import time
+from hashlib import sha256
 
 import jwt
+import orjson
+from cachetools import TTLCache
 from fastapi import Request, HTTPException
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer
 from starlette.status import HTTP_403_FORBIDDEN
 
 from src.config import settings as s
 
+_ACCESS_SECRET = s.jwt_secret.get_secret_value().encode()
+_REFRESH_SECRET = s.jwt_refresh_secret.get_secret_value().encode()
+_ALGS = (s.algorithm,)
+_DECODE_OPTIONS = {"require": ["exp", "iat", "user_id", "type"], "verify_exp": True}
+_AT_DELTA = s.jwt_expires_in * 60
+_RT_DELTA = s.jwt_refresh_expires_in * 60
+_MAX_TOKEN_LENGTH = 8192
+
+
+# PyJWT con il payload codificato/decodificato tramite orjson invece di json
+class OrjsonJWT(jwt.PyJWT):
+    def _encode_payload(
+        self,
+        payload: dict[str, Any],
+        headers: dict[str, Any] | None = None,
+        json_encoder: Any = None,
+    ) -> bytes:
+        return orjson.dumps(payload)
+
+    def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except orjson.JSONDecodeError as e:
+            raise jwt.DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise jwt.DecodeError("Invalid payload string: must be a json object")
+        return payload
+
+
+_jwt = OrjsonJWT()
+
+# Cache dei token già verificati: chiave sha256(token), durata massima 5 secondi
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=5)
+
+
 class TokenType(str, Enum):
     ACCESS_TOKEN = "access_token"
     REFRESH_TOKEN = "refresh_token"
@@ -32,28 +70,40 @@ def sign_jwt(user_id: int) -> dict[TokenType, str]:
 
     iat = int(time.time())
     # Access Token
-    at_expiration_time = iat + s.jwt_expires_in * 60
+    at_expiration_time = iat + _AT_DELTA
     at_payload = {"user_id": user_id, "type": TokenType.ACCESS_TOKEN, "exp": at_expiration_time, "iat": iat}
-    access_token = jwt.encode(
-        at_payload, s.jwt_secret.get_secret_value(), algorithm=s.algorithm
+    access_token = _jwt.encode(
+        at_payload, _ACCESS_SECRET, algorithm=s.algorithm
     )
     # Refresh Token
-    rt_expiration_time = iat + s.jwt_refresh_expires_in * 60
+    rt_expiration_time = iat + _RT_DELTA
     rt_payload = {"user_id": user_id, "type": TokenType.REFRESH_TOKEN, "exp": rt_expiration_time, "iat": iat }
-    refresh_token = jwt.encode(
-        rt_payload, s.jwt_refresh_secret.get_secret_value(), algorithm=s.algorithm
+    refresh_token = _jwt.encode(
+        rt_payload, _REFRESH_SECRET, algorithm=s.algorithm
     )
     return { TokenType.ACCESS_TOKEN: access_token, TokenType.REFRESH_TOKEN: refresh_token }
 
 
 def decode_jwt(token: str, is_refresh_token: bool) -> JWTPayload:
-    secret = s.jwt_secret.get_secret_value()
-    if is_refresh_token:
-        secret = s.jwt_refresh_secret.get_secret_value()
+    # Scarto subito i token malformati (header.payload.signature) o troppo lunghi
+    if len(token) > _MAX_TOKEN_LENGTH or token.count(".") != 2:
+        raise HTTPException(status_code=401, detail="Invalid token.")
+
+    cache_key = (is_refresh_token, sha256(token.encode()).digest())
+    cached: JWTPayload | None = _jwt_cache.get(cache_key)
+    if cached is not None and cached.exp > time.time():
+        return cached
 
     try:
-        decoded = jwt.decode(token, secret, algorithms=[s.algorithm])
-        return JWTPayload(**decoded)
+        decoded = _jwt.decode(
+            token,
+            _REFRESH_SECRET if is_refresh_token else _ACCESS_SECRET,
+            algorithms=_ALGS,
+            options=_DECODE_OPTIONS,
+        )
+        payload = JWTPayload(**decoded)
+        _jwt_cache[cache_key] = payload
+        return payload
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Expired token.")
     except jwt.InvalidTokenError:
@@ -66,14 +116,21 @@ class JWTBearer(HTTPBearer):
         self.is_refresh_token = is_refresh_token
 
     async def __call__(self, request: Request) -> RefreshTokenContext | int:
-        credentials: HTTPAuthorizationCredentials | None = await super().__call__(request)
-        if not credentials:
+        # Leggo direttamente l'header Authorization, senza passare da
+        # HTTPBearer.__call__ e HTTPAuthorizationCredentials
+        authorization = request.headers.get("authorization") or ""
+        scheme, _, provided_token = authorization.partition(" ")
+        if not (scheme and provided_token):
+            raise HTTPException(
+                    status_code=HTTP_403_FORBIDDEN,
+                    detail="Not authenticated" if self.auto_error else "Invalid authentication credentials",
+                )
+        if scheme.lower() != "bearer":
             raise HTTPException(
                     status_code=HTTP_403_FORBIDDEN,
                     detail="Invalid authentication credentials",
                 )
 
-        provided_token = credentials.credentials
         decoded_payload: JWTPayload = decode_jwt(provided_token, self.is_refresh_token)
         user_id: int = decoded_payload.user_id
 
@@ -83,3 +140,7 @@ class JWTBearer(HTTPBearer):
                 provided_token=provided_token,
             )
         return user_id
+
+
+access_bearer = JWTBearer(is_refresh_token=False)
+refresh_bearer = JWTBearer(is_refresh_token=True)
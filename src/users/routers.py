@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+from cryptography.exceptions import InvalidTag
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,7 +8,7 @@ from sqlalchemy.future import select
 
 from src.database import get_async_session
 from src.events.schemas import EventResponse
-from src.security import sign_jwt, JWTBearer, RefreshTokenContext, TokenType
+from src.security import sign_jwt, access_bearer, refresh_bearer, RefreshTokenContext, TokenType
 from src.users.models import User
 from src.users.schemas import UserCreate, UserResponse, UserUpdate, UserLogin
 
@@ -22,7 +23,7 @@ router = APIRouter(
 @router.get("/me", response_model=UserResponse)
 async def me(
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(User).where(User.id == user_id)
     query_result = await session.scalars(query)
@@ -60,7 +61,7 @@ async def login(payload: UserLogin, session: AsyncSession = Depends(get_async_se
 @router.post("/refresh-token")
 async def refresh_token(
     session: AsyncSession = Depends(get_async_session),
-    auth_data: RefreshTokenContext = Depends(JWTBearer(is_refresh_token=True)),
+    auth_data: RefreshTokenContext = Depends(refresh_bearer),
 ):
     user_id: int = auth_data.user_id
     provided_refresh_token: str = auth_data.provided_token
@@ -71,10 +72,16 @@ async def refresh_token(
     if not result:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if (
-        not result.refresh_token
-        or e.decrypt(result.refresh_token) != provided_refresh_token
-    ):
+    if not result.refresh_token:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    try:
+        stored_refresh_token = e.decrypt(result.refresh_token)
+    except InvalidTag:
+        # token cifrato con un formato precedente (AES-CBC) o manomesso
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    if stored_refresh_token != provided_refresh_token:
         raise HTTPException(status_code=401, detail="Invalid refresh token")
 
     tokens = sign_jwt(result.id)
@@ -116,7 +123,7 @@ async def get_user(user_id: int, session: AsyncSession = Depends(get_async_sessi
 async def update_user(
     payload: UserUpdate,
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(User).where(User.id == user_id)
     query_result = await session.scalars(query)
@@ -138,7 +145,7 @@ async def update_user(
 @router.delete("/", status_code=204)
 async def delete_user(
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(User).where(User.id == user_id)
     query_result = await session.scalars(query)
@@ -152,7 +159,7 @@ async def delete_user(
 
 @router.get("/get/events", response_model=Optional[List[EventResponse]])
 async def get_user_events(
-    session: AsyncSession = Depends(get_async_session), user_id=Depends(JWTBearer())
+    session: AsyncSession = Depends(get_async_session), user_id=Depends(access_bearer)
 ):
     query = select(User).where(User.id == user_id)
     query_result = await session.scalars(query)
@@ -165,7 +172,7 @@ async def get_user_events(
 @router.delete("/logout", status_code=204)
 async def logout(
     session: AsyncSession = Depends(get_async_session),
-    user_id: int = Depends(JWTBearer()),
+    user_id: int = Depends(access_bearer),
 ):
     query = select(User).where(User.id == user_id)
     query_result = await session.scalars(query)